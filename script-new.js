@@ -9,6 +9,16 @@ class StudyPlannerKanban {
         this.draggedCard = null;
         this.isDragging = false;
         this.taskCounter = parseInt(localStorage.getItem('taskCounter')) || 1;
+        this.dirtyCards = false;
+        this.dirtyColumns = false;
+        this.flushHandle = null;
+        this.opLogPrefix = 'studyOpLog_';
+        this.opLogCompactThreshold = 50;
+        this.opLogArchiveKey = 'studyOpLogArchive';
+        this.opLogArchiveLimit = 500;
+        this.opLogKeys = [];
+        this.opSeq = 0;
+        this.replayOpLog();
         this.init();
     }
 
@@ -26,7 +36,6 @@ class StudyPlannerKanban {
     generateTaskId() {
         const taskId = `TSK-${String(this.taskCounter).padStart(3, '0')}`;
         this.taskCounter++;
-        localStorage.setItem('taskCounter', this.taskCounter.toString());
         return taskId;
     }
 
@@ -67,7 +76,8 @@ class StudyPlannerKanban {
             }
         });
         if (needsSave) {
-            this.saveToStorage();
+            this.dirtyCards = true;
+            this.scheduleFlush();
         }
     }
 
@@ -128,6 +138,17 @@ class StudyPlannerKanban {
             this.deleteCard();
         });
 
+        // Write any deferred changes before the page goes away
+        window.addEventListener('pagehide', () => {
+            this.flushStorage();
+        });
+
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') {
+                this.flushStorage();
+            }
+        });
+
         // Close modals when clicking outside
         window.addEventListener('click', (e) => {
             const cardModal = document.getElementById('cardModal');
@@ -210,12 +231,15 @@ class StudyPlannerKanban {
             return;
         }
 
+        let savedColumn = null;
+
         if (this.currentEditColumnId) {
             // Update existing column
             const column = this.columns.find(c => c.id === this.currentEditColumnId);
             if (column) {
                 column.name = name;
                 column.color = color;
+                savedColumn = column;
                 console.log(`✅ Updated column "${column.name}" successfully (Enter key saves!)`);
             }
         } else {
@@ -227,11 +251,14 @@ class StudyPlannerKanban {
                 order: this.columns.length + 1
             };
             this.columns.push(newColumn);
+            savedColumn = newColumn;
             console.log(`✅ Created new column "${newColumn.name}" successfully (Enter key saves!)`);
         }
 
         // Save to storage first
-        this.saveColumnsToStorage();
+        if (savedColumn) {
+            this.recordOp('saveColumn', { column: savedColumn });
+        }
         
         // Close modal before re-rendering to avoid conflicts
         this.closeColumnModal();
@@ -259,11 +286,10 @@ class StudyPlannerKanban {
             }
             // Remove cards in this column
             this.cards = this.cards.filter(c => c.status !== this.currentEditColumnId);
-            this.saveToStorage();
         }
 
         this.columns = this.columns.filter(c => c.id !== this.currentEditColumnId);
-        this.saveColumnsToStorage();
+        this.recordOp('deleteColumn', { columnId: this.currentEditColumnId });
         this.renderColumns();
         this.renderCards();
         this.updateStats();
@@ -518,6 +544,7 @@ class StudyPlannerKanban {
             const cardIndex = this.cards.findIndex(c => c.id === this.currentEditId);
             if (cardIndex !== -1) {
                 this.cards[cardIndex] = { ...this.cards[cardIndex], ...cardData };
+                this.recordOp('updateCard', { card: this.cards[cardIndex] });
             }
         } else {
             // Create new card
@@ -528,9 +555,9 @@ class StudyPlannerKanban {
                 ...cardData
             };
             this.cards.push(newCard);
+            this.recordOp('createCard', { card: newCard, taskCounter: this.taskCounter });
         }
 
-        this.saveToStorage();
         this.renderCards();
         this.updateStats();
         this.closeCardModal();
@@ -542,7 +569,7 @@ class StudyPlannerKanban {
         
         if (card && card.status !== newStatus && targetColumn) {
             card.status = newStatus;
-            this.saveToStorage();
+            this.recordOp('moveCard', { cardId, status: newStatus });
             this.renderCards();
             this.updateStats();
         }
@@ -553,7 +580,11 @@ class StudyPlannerKanban {
         if (card) {
             card.isCompleted = !card.isCompleted;
             card.completedDate = card.isCompleted ? new Date().toISOString() : null;
-            this.saveToStorage();
+            this.recordOp('toggleCard', {
+                cardId,
+                isCompleted: card.isCompleted,
+                completedDate: card.completedDate
+            });
             this.renderCards();
             this.updateStats();
         }
@@ -660,23 +691,34 @@ class StudyPlannerKanban {
             }
         });
 
-        // Group cards by status
+        // Group cards by status in a single pass over the board
         const cardsByStatus = {};
         this.columns.forEach(col => {
-            cardsByStatus[col.id] = this.cards.filter(card => card.status === col.id);
+            cardsByStatus[col.id] = [];
+        });
+        this.cards.forEach(card => {
+            if (cardsByStatus[card.status]) {
+                cardsByStatus[card.status].push(card);
+            }
+        });
+
+        // Parse each due date once instead of on every comparison
+        const priorityOrder = { high: 3, medium: 2, low: 1 };
+        const dueTimes = new Map();
+        this.cards.forEach(card => {
+            if (card.dueDate) dueTimes.set(card, new Date(card.dueDate).getTime());
         });
 
         // Sort and render cards
         Object.keys(cardsByStatus).forEach(status => {
             cardsByStatus[status].sort((a, b) => {
                 // First by priority
-                const priorityOrder = { high: 3, medium: 2, low: 1 };
                 const priorityDiff = priorityOrder[b.priority] - priorityOrder[a.priority];
                 if (priorityDiff !== 0) return priorityDiff;
 
                 // Then by due date
                 if (a.dueDate && b.dueDate) {
-                    return new Date(a.dueDate) - new Date(b.dueDate);
+                    return dueTimes.get(a) - dueTimes.get(b);
                 }
                 if (a.dueDate && !b.dueDate) return -1;
                 if (!a.dueDate && b.dueDate) return 1;
@@ -688,10 +730,12 @@ class StudyPlannerKanban {
             if (columnContent) {
                 const addButton = columnContent.querySelector('.add-card-column-btn');
                 
+                // Build the column off-DOM and attach it in one insertion
+                const fragment = document.createDocumentFragment();
                 cardsByStatus[status].forEach(card => {
-                    const cardElement = this.createCardElement(card);
-                    columnContent.insertBefore(cardElement, addButton);
+                    fragment.appendChild(this.createCardElement(card));
                 });
+                columnContent.insertBefore(fragment, addButton);
             }
         });
     }
@@ -783,21 +827,33 @@ class StudyPlannerKanban {
     }
 
     updateStats() {
+        const now = new Date();
         const stats = {
             total: this.cards.length,
-            completed: this.cards.filter(c => c.isCompleted).length,
-            overdue: this.cards.filter(c => 
-                c.dueDate && 
-                new Date(c.dueDate) < new Date() && 
-                !c.isCompleted
-            ).length
+            completed: 0,
+            overdue: 0
         };
 
-        // Add dynamic column stats
+        const columnCounts = {};
         this.columns.forEach(column => {
-            stats[column.id] = this.cards.filter(c => c.status === column.id).length;
+            columnCounts[column.id] = 0;
         });
 
+        // Tally everything in a single pass over the cards
+        this.cards.forEach(c => {
+            if (c.isCompleted) {
+                stats.completed++;
+            } else if (c.dueDate && new Date(c.dueDate) < now) {
+                stats.overdue++;
+            }
+            if (columnCounts[c.status] !== undefined) {
+                columnCounts[c.status]++;
+            }
+        });
+
+        // Add dynamic column stats
+        Object.assign(stats, columnCounts);
+
         // Update stats modal with dynamic content
         const totalElement = document.getElementById('totalCards');
         const completedElement = document.getElementById('completedCards');
@@ -821,7 +877,7 @@ class StudyPlannerKanban {
 
         if (confirm('Are you sure you want to delete this card?')) {
             this.cards = this.cards.filter(c => c.id !== this.currentEditId);
-            this.saveToStorage();
+            this.recordOp('deleteCard', { cardId: this.currentEditId });
             this.renderCards();
             this.updateStats();
             this.closeCardModal();
@@ -845,12 +901,229 @@ class StudyPlannerKanban {
         return tomorrow.toDateString() === cardDate.toDateString();
     }
 
-    saveToStorage() {
-        localStorage.setItem('studyCards', JSON.stringify(this.cards));
+    // Snapshot writes are deferred to idle time so they never run inside a
+    // UI handler, and several requests before the next idle period share one
+    scheduleFlush(delay = 0) {
+        if (this.flushHandle) return;
+
+        const run = () => {
+            this.flushHandle = null;
+            this.flushStorage();
+        };
+
+        if (delay > 0) {
+            this.flushHandle = setTimeout(run, delay);
+        } else if (typeof window.requestIdleCallback === 'function') {
+            this.flushHandle = window.requestIdleCallback(run, { timeout: 1000 });
+        } else {
+            this.flushHandle = setTimeout(run, 0);
+        }
+    }
+
+    // Compact: write a full snapshot, then move the log entries it covers
+    // from the live log into the archive
+    flushStorage() {
+        if (this.opLogKeys.length > 0) {
+            this.dirtyCards = true;
+            this.dirtyColumns = true;
+        }
+        try {
+            if (this.dirtyCards) {
+                localStorage.setItem('studyCards', JSON.stringify(this.cards));
+                localStorage.setItem('taskCounter', this.taskCounter.toString());
+                this.dirtyCards = false;
+            }
+            if (this.dirtyColumns) {
+                localStorage.setItem('studyColumns', JSON.stringify(this.columns));
+                this.dirtyColumns = false;
+            }
+        } catch (error) {
+            // The board matters more than its history: free the archive's
+            // space and try once more before giving up
+            if (localStorage.getItem(this.opLogArchiveKey) !== null) {
+                console.error('❌ Storage full, dropping operation log archive:', error);
+                localStorage.removeItem(this.opLogArchiveKey);
+                this.flushStorage();
+                return;
+            }
+
+            // Keep the log entries and dirty flags and queue a retry, spaced
+            // out so a full quota doesn't reserialize the board in a loop;
+            // the board in memory stays as it is
+            console.error('❌ Could not write snapshot to storage:', error);
+            this.scheduleFlush(5000);
+            return;
+        }
+
+        this.archiveOpLog();
+    }
+
+    // Compacted entries move into a capped archive that serves as the audit
+    // trail. Only what changed and when is kept, never card contents, so
+    // each entry is a fixed small size and opLogArchiveLimit bounds its bytes
+    archiveOpLog() {
+        if (this.opLogKeys.length === 0) return;
+
+        const summaries = [];
+        this.opLogKeys.forEach(key => {
+            try {
+                const entry = localStorage.getItem(key);
+                if (entry) summaries.push(this.summarizeOp(JSON.parse(entry)));
+            } catch (error) {
+                console.error(`❌ Skipping unreadable log entry ${key}:`, error);
+            }
+        });
+
+        // Retire the live entries before archiving them: if the page dies in
+        // between, history loses a few entries rather than replaying and
+        // archiving the same edits twice on the next start
+        this.opLogKeys.forEach(key => localStorage.removeItem(key));
+        this.opLogKeys = [];
+
+        try {
+            const archive = JSON.parse(localStorage.getItem(this.opLogArchiveKey)) || [];
+            archive.push(...summaries);
+            localStorage.setItem(
+                this.opLogArchiveKey,
+                JSON.stringify(archive.slice(-this.opLogArchiveLimit))
+            );
+        } catch (error) {
+            // The snapshot is already safe, so losing audit history is not fatal
+            console.error('❌ Could not archive operation log:', error);
+        }
+    }
+
+    summarizeOp(op) {
+        const summary = { type: op.type, at: op.at };
+        if (op.card) summary.cardId = op.card.id;
+        if (op.cardId !== undefined) summary.cardId = op.cardId;
+        if (op.column) summary.columnId = op.column.id;
+        if (op.columnId !== undefined) summary.columnId = op.columnId;
+        if (op.status !== undefined) summary.columnId = op.status;
+        return summary;
+    }
+
+    // Operation log: every edit is appended as its own small entry, so a
+    // change costs a few hundred bytes instead of a whole-board rewrite.
+    // Entries stay live until the next compaction folds them into the
+    // snapshot, after which they are kept in the capped archive.
+    recordOp(type, data) {
+        // The log only makes sense on top of a written snapshot, so catch up
+        // on any snapshot write still pending (e.g. after a quota failure)
+        if (this.dirtyCards || this.dirtyColumns) {
+            this.dirtyCards = true;
+            this.dirtyColumns = true;
+            this.flushStorage();
+            if (this.dirtyCards || this.dirtyColumns) return;
+        }
+
+        const op = { type, at: new Date().toISOString(), ...data };
+        const key = `${this.opLogPrefix}${this.opSeq}`;
+
+        try {
+            localStorage.setItem(key, JSON.stringify(op));
+        } catch (error) {
+            // Out of quota: fold everything into the snapshot right away
+            console.error('❌ Could not append to operation log, compacting:', error);
+            this.dirtyCards = true;
+            this.dirtyColumns = true;
+            this.flushStorage();
+            return;
+        }
+
+        this.opSeq++;
+        this.opLogKeys.push(key);
+
+        if (this.opLogKeys.length >= this.opLogCompactThreshold) {
+            this.scheduleFlush();
+        }
     }
 
-    saveColumnsToStorage() {
-        localStorage.setItem('studyColumns', JSON.stringify(this.columns));
+    // Rebuild state from the snapshot plus any entries logged after it
+    replayOpLog() {
+        const entries = [];
+        for (let i = 0; i < localStorage.length; i++) {
+            const key = localStorage.key(i);
+            if (!key || !key.startsWith(this.opLogPrefix)) continue;
+
+            // Ignore stray keys so a bad suffix can't turn opSeq into NaN
+            const suffix = key.slice(this.opLogPrefix.length);
+            const seq = Number(suffix);
+            if (suffix === '' || !Number.isInteger(seq) || seq < 0) continue;
+
+            entries.push({ key, seq });
+        }
+        if (entries.length === 0) return;
+
+        entries.sort((a, b) => a.seq - b.seq);
+        entries.forEach(({ key, seq }) => {
+            try {
+                this.applyOp(JSON.parse(localStorage.getItem(key)));
+            } catch (error) {
+                console.error(`❌ Skipping unreadable log entry ${key}:`, error);
+            }
+            this.opLogKeys.push(key);
+            this.opSeq = Math.max(this.opSeq, seq + 1);
+        });
+
+        console.log(`✅ Replayed ${entries.length} logged change(s)`);
+        this.scheduleFlush();
+    }
+
+    // Ops carry absolute values, so applying one twice is harmless; this
+    // keeps replay safe if a compaction was interrupted part way through
+    applyOp(op) {
+        switch (op.type) {
+            case 'createCard':
+            case 'updateCard': {
+                const index = this.cards.findIndex(c => c.id === op.card.id);
+                if (index !== -1) {
+                    this.cards[index] = op.card;
+                } else {
+                    this.cards.push(op.card);
+                }
+                if (op.taskCounter) {
+                    this.taskCounter = Math.max(this.taskCounter, op.taskCounter);
+                }
+                break;
+            }
+            case 'moveCard': {
+                const card = this.cards.find(c => c.id === op.cardId);
+                if (card) card.status = op.status;
+                break;
+            }
+            case 'toggleCard': {
+                const card = this.cards.find(c => c.id === op.cardId);
+                if (card) {
+                    card.isCompleted = op.isCompleted;
+                    card.completedDate = op.completedDate;
+                }
+                break;
+            }
+            case 'deleteCard':
+                this.cards = this.cards.filter(c => c.id !== op.cardId);
+                break;
+            case 'saveColumn': {
+                const index = this.columns.findIndex(c => c.id === op.column.id);
+                if (index !== -1) {
+                    this.columns[index] = op.column;
+                } else {
+                    this.columns.push(op.column);
+                }
+                break;
+            }
+            case 'deleteColumn':
+                this.cards = this.cards.filter(c => c.status !== op.columnId);
+                this.columns = this.columns.filter(c => c.id !== op.columnId);
+                break;
+            case 'clearAll':
+                this.cards = [];
+                this.columns = this.getDefaultColumns();
+                this.taskCounter = 1;
+                break;
+            default:
+                console.error('❌ Unknown log entry type:', op.type);
+        }
     }
 
     // Export to PDF functionality
@@ -908,12 +1181,29 @@ class StudyPlannerKanban {
             </div>
         `;
 
+        // Parse each due date once and bucket cards by section in the same pass
+        const now = new Date();
+        const dueTimes = new Map();
+        const cardsByColumn = {};
+        this.columns.forEach(column => {
+            cardsByColumn[column.id] = [];
+        });
+
         // Add summary statistics
         const totalCards = this.cards.length;
-        const completedCards = this.cards.filter(c => c.isCompleted).length;
-        const overdueCards = this.cards.filter(c => 
-            c.dueDate && new Date(c.dueDate) < new Date() && !c.isCompleted
-        ).length;
+        let completedCards = 0;
+        let overdueCards = 0;
+        let cardsWithDueDates = 0;
+        this.cards.forEach(c => {
+            if (c.dueDate) {
+                const dueTime = new Date(c.dueDate).getTime();
+                dueTimes.set(c, dueTime);
+                cardsWithDueDates++;
+                if (dueTime < now && !c.isCompleted) overdueCards++;
+            }
+            if (c.isCompleted) completedCards++;
+            if (cardsByColumn[c.status]) cardsByColumn[c.status].push(c);
+        });
 
         htmlContent += `
             <div class="summary">
@@ -936,7 +1226,7 @@ class StudyPlannerKanban {
                         <div class="stat-label">Overdue</div>
                     </div>
                     <div class="stat-item">
-                        <div class="stat-number">${this.cards.filter(c => c.dueDate).length}</div>
+                        <div class="stat-number">${cardsWithDueDates}</div>
                         <div class="stat-label">With Due Dates</div>
                     </div>
                 </div>
@@ -945,10 +1235,11 @@ class StudyPlannerKanban {
 
         // Sort columns by order
         const sortedColumns = [...this.columns].sort((a, b) => a.order - b.order);
+        const priorityOrder = { high: 3, medium: 2, low: 1 };
 
         // Add each section with its cards
         sortedColumns.forEach(column => {
-            const columnCards = this.cards.filter(c => c.status === column.id);
+            const columnCards = cardsByColumn[column.id];
             const completedInColumn = columnCards.filter(c => c.isCompleted).length;
             
             htmlContent += `<div class="section">`;
@@ -964,12 +1255,11 @@ class StudyPlannerKanban {
                         return a.isCompleted ? 1 : -1;
                     }
                     
-                    const priorityOrder = { high: 3, medium: 2, low: 1 };
                     const priorityDiff = priorityOrder[b.priority] - priorityOrder[a.priority];
                     if (priorityDiff !== 0) return priorityDiff;
 
                     if (a.dueDate && b.dueDate) {
-                        return new Date(a.dueDate) - new Date(b.dueDate);
+                        return dueTimes.get(a) - dueTimes.get(b);
                     }
                     if (a.dueDate && !b.dueDate) return -1;
                     if (!a.dueDate && b.dueDate) return 1;
@@ -977,7 +1267,7 @@ class StudyPlannerKanban {
                 });
 
                 columnCards.forEach(card => {
-                    const isOverdue = card.dueDate && new Date(card.dueDate) < new Date() && !card.isCompleted;
+                    const isOverdue = card.dueDate && dueTimes.get(card) < now && !card.isCompleted;
                     const isTomorrow = card.dueDate && this.isTomorrow(card.dueDate);
 
                     let dueDateHtml = '';
@@ -1043,21 +1333,27 @@ class StudyPlannerKanban {
         const daysInMonth = lastDay.getDate();
         const startingDayOfWeek = firstDay.getDay(); // 0 = Sunday
 
-        // Get tasks for this month
-        const monthTasks = this.cards.filter(card => {
-            if (!card.dueDate) return false;
+        // Count this month's tasks per day, parsing each due date only once
+        const tasksByDay = {};
+        this.cards.forEach(card => {
+            if (!card.dueDate) return;
             const taskDate = new Date(card.dueDate);
-            return taskDate.getMonth() === month && taskDate.getFullYear() === year;
-        });
+            if (taskDate.getMonth() !== month || taskDate.getFullYear() !== year) return;
 
-        // Group tasks by day
-        const tasksByDay = {};
-        monthTasks.forEach(task => {
-            const day = new Date(task.dueDate).getDate();
-            if (!tasksByDay[day]) tasksByDay[day] = [];
-            tasksByDay[day].push(task);
+            const day = taskDate.getDate();
+            if (!tasksByDay[day]) tasksByDay[day] = { total: 0, completed: 0, overdue: 0 };
+            tasksByDay[day].total++;
+            if (card.isCompleted) {
+                tasksByDay[day].completed++;
+            } else if (taskDate < today) {
+                tasksByDay[day].overdue++;
+            }
         });
 
+        const prevMonth = month === 0 ? 11 : month - 1;
+        const prevYear = month === 0 ? year - 1 : year;
+        const prevMonthDays = new Date(prevYear, prevMonth + 1, 0).getDate();
+
         let calendarHtml = `
             <table class="calendar">
                 <thead>
@@ -1083,9 +1379,6 @@ class StudyPlannerKanban {
             for (let dayOfWeek = 0; dayOfWeek < 7; dayOfWeek++) {
                 if (week === 0 && dayOfWeek < startingDayOfWeek) {
                     // Previous month's days
-                    const prevMonth = month === 0 ? 11 : month - 1;
-                    const prevYear = month === 0 ? year - 1 : year;
-                    const prevMonthDays = new Date(prevYear, prevMonth + 1, 0).getDate();
                     const dayNumber = prevMonthDays - (startingDayOfWeek - dayOfWeek - 1);
                     calendarHtml += `<td class="other-month"><div class="day-number">${dayNumber}</div></td>`;
                 } else if (currentDay > daysInMonth) {
@@ -1096,32 +1389,29 @@ class StudyPlannerKanban {
                 } else {
                     // Current month's days
                     const isToday = (currentDay === today.getDate() && month === today.getMonth() && year === today.getFullYear());
-                    const dayTasks = tasksByDay[currentDay] || [];
-                    const hasOverdue = dayTasks.some(task => new Date(task.dueDate) < today && !task.isCompleted);
-                    const hasCompleted = dayTasks.some(task => task.isCompleted);
+                    const dayTasks = tasksByDay[currentDay];
+                    const hasOverdue = dayTasks && dayTasks.overdue > 0;
+                    const hasCompleted = dayTasks && dayTasks.completed > 0;
                     
                     let cellClass = '';
                     if (isToday) cellClass = 'today';
                     else if (hasCompleted) cellClass = 'has-completed';
                     else if (hasOverdue) cellClass = 'has-overdue';
-                    else if (dayTasks.length > 0) cellClass = 'has-tasks';
+                    else if (dayTasks) cellClass = 'has-tasks';
 
                     let indicator = '';
-                    if (dayTasks.length > 0) {
-                        const completedTasks = dayTasks.filter(task => task.isCompleted).length;
-                        const overdueTasks = dayTasks.filter(task => new Date(task.dueDate) < today && !task.isCompleted).length;
-                        
+                    if (dayTasks) {
                         let indicatorClass = '';
                         let indicatorText = '';
                         
-                        if (completedTasks > 0) {
+                        if (hasCompleted) {
                             indicatorClass = 'completed-indicator';
-                            indicatorText = `${completedTasks} done`;
-                        } else if (overdueTasks > 0) {
+                            indicatorText = `${dayTasks.completed} done`;
+                        } else if (hasOverdue) {
                             indicatorClass = 'overdue-indicator';
-                            indicatorText = `${dayTasks.length} task${dayTasks.length > 1 ? 's' : ''}`;
+                            indicatorText = `${dayTasks.total} task${dayTasks.total > 1 ? 's' : ''}`;
                         } else {
-                            indicatorText = `${dayTasks.length} task${dayTasks.length > 1 ? 's' : ''}`;
+                            indicatorText = `${dayTasks.total} task${dayTasks.total > 1 ? 's' : ''}`;
                         }
                         
                         indicator = `<div class="task-indicator ${indicatorClass}">${indicatorText}</div>`;
@@ -1157,7 +1447,7 @@ class StudyPlannerKanban {
         const totalCards = this.cards.length;
         const totalSections = this.columns.length;
         
-        const confirmMessage = `Are you sure you want to clear all data?\n\nThis will permanently delete:\n- ${totalCards} cards\n- ${totalSections} custom categories\n\nThis action cannot be undone.\n\nAfter clearing, you'll start with 3 blank categories that you can rename to anything you want.`;
+        const confirmMessage = `Are you sure you want to clear all data?\n\nThis will permanently delete:\n- ${totalCards} cards\n- ${totalSections} custom categories\n- the change history\n\nThis action cannot be undone.\n\nAfter clearing, you'll start with 3 blank categories that you can rename to anything you want.`;
         
         if (confirm(confirmMessage)) {
             // Reset to default state with generic names
@@ -1165,10 +1455,11 @@ class StudyPlannerKanban {
             this.columns = this.getDefaultColumns();
             this.taskCounter = 1;
             
-            // Save to storage
-            this.saveToStorage();
-            this.saveColumnsToStorage();
-            localStorage.setItem('taskCounter', '1');
+            // Save to storage, then compact right away so the cleared cards
+            // don't linger in the log and drop the change history with them
+            this.recordOp('clearAll', {});
+            this.flushStorage();
+            localStorage.removeItem(this.opLogArchiveKey);
             
             // Re-render everything
             this.renderColumns();